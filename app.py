@@ -4,17 +4,18 @@ Scans U.S. stocks based on technical criteria
 """
 import streamlit as st
 import yfinance as yf
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import List, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
 import time
 from ticker_utils import get_tickers_by_market
 
 # Import scanner libraries
-from scanners.scan_price_surge import scan_price_surge
-from scanners.scan_upward_gap import scan_upward_gap
-from scanners.scan_continuous_uptrend import scan_continuous_uptrend
-from scanners.scan_volume_breakout import scan_volume_breakout
+from scanners.fused import run_all_scans
 
 
 # Page configuration
@@ -26,159 +27,457 @@ st.set_page_config(
 )
 
 
+# Number of tickers bundled into a single Yahoo Finance request
+BATCH_SIZE = 20
+
+# Number of batch downloads in flight at once (network-bound work)
+MAX_FETCH_WORKERS = 16
+
+# On-disk OHLCV cache shared across scans and across app restarts
+CACHE_DIR = Path('cache')
+CACHE_TTL_SECONDS = 86400  # 24 hours
+
+# Retry budget for rate-limited / flaky Yahoo requests
+MAX_FETCH_RETRIES = 3
+
+# Rolling window (trading days) for the volume breakout moving average
+VOLUME_MA_PERIOD = 50
+
+# One shared session for every Yahoo request, so the cookie/crumb
+# handshake is negotiated once instead of per fetch (repeated handshakes
+# are the main trigger for YFRateLimitError). curl_cffi survives
+# Yahoo's bot checks better than plain requests; fall back if missing.
+try:
+    from curl_cffi import requests as _curl_requests
+    _SESSION = _curl_requests.Session(impersonate="chrome")
+except ImportError:
+    import requests as _plain_requests
+    _SESSION = _plain_requests.Session()
+
+
+class _TokenBucket:
+    """
+    Thread-safe rate limiter shared by all fetch workers.
+
+    Spaces requests at 1/rate seconds globally, which keeps the same
+    politeness toward Yahoo as the old per-ticker sleep did, but without
+    putting a serial floor under concurrent downloads.
+    """
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self) -> None:
+        """Block until this caller's request slot arrives."""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self._interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+# Global budget of 10 Yahoo requests per second across all threads
+_YAHOO_BUCKET = _TokenBucket(rate=10)
+
+
+def _downcast_ohlcv(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Narrow OHLCV dtypes ahead of scanning.
+
+    float32 prices and uint64 volumes are plenty for threshold
+    comparisons and halve the bytes the scan kernels have to stream.
+    Volume gaps (NaN from calendar alignment) become 0-volume days.
+    """
+    casts = {col: 'float32' for col in ('Open', 'High', 'Low', 'Close', 'Adj Close')
+             if col in data.columns}
+    if casts:
+        data = data.astype(casts)
+    if 'Volume' in data.columns:
+        data['Volume'] = data['Volume'].fillna(0).astype('uint64')
+    return data
+
+
+def _cache_path(ticker: str, start_date: datetime, end_date: datetime) -> Path:
+    """Build the parquet cache path for a (ticker, start, end) fetch window."""
+    return CACHE_DIR / f"{ticker}_{start_date:%Y%m%d}_{end_date:%Y%m%d}.parquet"
+
+
+def _read_cached_frame(ticker: str, start_date: datetime, end_date: datetime) -> pd.DataFrame:
+    """
+    Read a ticker's cached OHLCV frame from disk, or None on miss.
+
+    A cache file older than CACHE_TTL_SECONDS is treated as a miss so the
+    next scan refreshes it.
+    """
+    path = _cache_path(ticker, start_date, end_date)
+
+    try:
+        if not path.exists():
+            return None
+        if time.time() - path.stat().st_mtime > CACHE_TTL_SECONDS:
+            return None
+        return pd.read_parquet(path)
+    except Exception:
+        return None
+
+
+def _write_cached_frame(ticker: str, start_date: datetime, end_date: datetime, data: pd.DataFrame) -> None:
+    """
+    Persist a ticker's OHLCV frame to the on-disk cache.
+
+    When the fetch window includes today, today's (still partial) bar is
+    trimmed from the persisted copy so a stale intraday row is never
+    served from cache. Cache failures are non-fatal.
+    """
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+
+        to_store = data
+        if end_date.date() >= datetime.now().date() and len(data) > 0:
+            if data.index[-1].date() >= datetime.now().date():
+                to_store = data.iloc[:-1]
+
+        if len(to_store) >= 10:
+            to_store.to_parquet(_cache_path(ticker, start_date, end_date))
+    except Exception:
+        pass
+
+
+@st.cache_data(ttl=43200)  # ticker universes change slowly; refresh twice a day
+def _cached_tickers(market: str) -> List[str]:
+    """Memoized wrapper around get_tickers_by_market (which scrapes external sources)."""
+    return get_tickers_by_market(market)
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
 def fetch_stock_data(ticker: str, start_date: datetime, end_date: datetime) -> pd.DataFrame:
     """
     Fetch historical stock data for a given ticker.
-    
+
     Args:
         ticker: Stock ticker symbol
         start_date: Start date for data fetch
         end_date: End date for data fetch
-    
+
     Returns:
         DataFrame with stock data or None if error
     """
-    try:
-        stock = yf.Ticker(ticker)
-        data = stock.history(start=start_date, end=end_date)
-        
+    for attempt in range(MAX_FETCH_RETRIES):
+        try:
+            _YAHOO_BUCKET.acquire()
+            stock = yf.Ticker(ticker, session=_SESSION)
+            data = stock.history(start=start_date, end=end_date)
+
+            if data.empty or len(data) < 10:
+                return None
+
+            return _downcast_ohlcv(data)
+        except Exception as e:
+            if attempt == MAX_FETCH_RETRIES - 1:
+                return None
+            # Exponential backoff so rate-limited tickers are retried
+            # instead of silently dropped
+            time.sleep(2 ** attempt)
+
+    return None
+
+
+def fetch_stock_data_batch(tickers: List[str], start_date: datetime, end_date: datetime) -> Dict[str, pd.DataFrame]:
+    """
+    Fetch historical data for a batch of tickers in one Yahoo Finance request.
+
+    Uses yf.download with multiple symbols so up to BATCH_SIZE tickers share a
+    single HTTP round-trip instead of one request per ticker.
+
+    Args:
+        tickers: Batch of ticker symbols (ideally <= BATCH_SIZE)
+        start_date: Start date for data fetch
+        end_date: End date for data fetch
+
+    Returns:
+        Dictionary mapping ticker -> DataFrame (tickers with no usable data are omitted)
+    """
+    frames = {}
+
+    raw = None
+    for attempt in range(MAX_FETCH_RETRIES):
+        try:
+            _YAHOO_BUCKET.acquire()
+            raw = yf.download(
+                ' '.join(tickers),
+                start=start_date,
+                end=end_date,
+                group_by='ticker',
+                threads=True,
+                progress=False,
+                auto_adjust=False,
+                session=_SESSION
+            )
+            break
+        except Exception as e:
+            if attempt == MAX_FETCH_RETRIES - 1:
+                return frames
+            # Exponential backoff so rate-limited batches are retried
+            # instead of silently dropped
+            time.sleep(2 ** attempt)
+
+    if raw is None or raw.empty:
+        return frames
+
+    for ticker in tickers:
+        try:
+            if isinstance(raw.columns, pd.MultiIndex):
+                data = raw.xs(ticker, axis=1, level=0)
+            else:
+                # Single-ticker download returns flat columns
+                data = raw
+        except KeyError:
+            continue
+
+        # Drop rows where Yahoo returned no data for this ticker
+        data = data.dropna(how='all')
+
         if data.empty or len(data) < 10:
-            return None
-        
-        return data
-    except Exception as e:
-        return None
+            continue
+
+        data = _downcast_ohlcv(data)
+        frames[ticker] = data
+        _write_cached_frame(ticker, start_date, end_date, data)
+
+    return frames
+
 
+# Scan logic lives in the scanners package; the app uses the fused
+# single-pass runner (scanners/fused.py). The standalone modules
+# (scan_price_surge.py etc.) remain importable for direct use.
 
-# Scan functions are now imported from scanners package
-# See scanners/scan_price_surge.py
-# See scanners/scan_upward_gap.py
-# See scanners/scan_continuous_uptrend.py
-# See scanners/scan_volume_breakout.py
 
+def fetch_stock_histories(tickers: List[str], start_date: datetime, end_date: datetime) -> Dict[str, pd.DataFrame]:
+    """
+    Fetch OHLCV history for all tickers (cache first, then batched downloads).
+
+    This is the slow, network-bound stage; its result can be kept in
+    session state and re-scanned with different thresholds without
+    re-fetching anything.
 
-def perform_scans(tickers: List[str], start_date: datetime, end_date: datetime, 
+    Args:
+        tickers: List of ticker symbols
+        start_date: Start date for data fetch (includes buffer for calculations)
+        end_date: End date for data fetch
+
+    Returns:
+        Dictionary mapping ticker -> OHLCV DataFrame
+    """
+    progress_bar = st.progress(0)
+    status_text = st.empty()
+
+    # Each progress/status update is a websocket message to the browser;
+    # throttle to ~10/s so UI traffic never dominates large scans
+    ui_interval = 0.1
+    last_ui = 0.0
+
+    # Phase 1: Satisfy as many tickers as possible from the on-disk cache
+    stock_data: Dict[str, pd.DataFrame] = {}
+
+    status_text.text("Checking local cache...")
+    for ticker in tickers:
+        cached = _read_cached_frame(ticker, start_date, end_date)
+        if cached is not None:
+            stock_data[ticker] = cached
+
+    missing = [t for t in tickers if t not in stock_data]
+
+    with st.sidebar:
+        st.metric("Cache hits", len(stock_data))
+        st.metric("Cache misses", len(missing))
+
+    # Phase 2: Download the rest in batches (one HTTP request per BATCH_SIZE tickers),
+    # with several batch downloads running concurrently since the work is network-bound
+    chunks = [missing[i:i + BATCH_SIZE] for i in range(0, len(missing), BATCH_SIZE)]
+
+    with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+        futures = {
+            executor.submit(fetch_stock_data_batch, chunk, start_date, end_date): chunk
+            for chunk in chunks
+        }
+
+        done_chunks = 0
+        for future in as_completed(futures):
+            # Check if stop was requested
+            if st.session_state.get('stop_requested', False):
+                executor.shutdown(cancel_futures=True)
+                status_text.text(f"⏹️ Download stopped by user at batch {done_chunks}/{len(chunks)}")
+                st.warning(f"⚠️ Scan interrupted! Downloaded {done_chunks} out of {len(chunks)} batches.")
+                break
+
+            stock_data.update(future.result())
+
+            done_chunks += 1
+            if time.monotonic() - last_ui > ui_interval or done_chunks == len(chunks):
+                last_ui = time.monotonic()
+                progress_bar.progress(done_chunks / len(chunks))
+                status_text.text(f"Downloading batch {done_chunks}/{len(chunks)} ({len(stock_data)} tickers so far)...")
+
+    progress_bar.empty()
+    status_text.empty()
+
+    return stock_data
+
+
+def perform_scans(stock_data: Dict[str, pd.DataFrame],
                   scan_start_date: datetime,
                   price_surge_threshold: float = 0.05,
                   upward_gap_threshold: float = 0.01,
                   uptrend_min_days: int = 4,
-                  volume_breakout_threshold: float = 0.10) -> Dict[str, pd.DataFrame]:
+                  volume_breakout_threshold: float = 0.10,
+                  combined_only: bool = False) -> Dict[str, pd.DataFrame]:
     """
-    Perform all four scans on the given tickers.
-    
+    Perform all four scans on already-fetched ticker histories.
+
+    This is the fast, pure-compute stage: re-running it with different
+    thresholds touches no network or disk, so threshold tweaks after a
+    scan are nearly free.
+
     Args:
-        tickers: List of ticker symbols
-        start_date: Start date for data fetch (includes buffer for calculations)
-        end_date: End date for data fetch
+        stock_data: Mapping ticker -> OHLCV DataFrame from fetch_stock_histories
         scan_start_date: Actual start date for scan results
         price_surge_threshold: Threshold for price surge scan (default 0.05 = 5%)
         upward_gap_threshold: Threshold for upward gap scan (default 0.01 = 1%)
         uptrend_min_days: Minimum days for continuous uptrend (default 4)
         volume_breakout_threshold: Threshold for volume breakout (default 0.10 = 10%)
-    
+        combined_only: Only keep tickers with a volume breakout, skipping
+            the price scans on the rest (faster; the standalone A/B/C
+            tabs then only show those tickers)
+
     Returns:
         Dictionary with scan results
     """
-    scan_a_results = []
-    scan_b_results = []
-    scan_c_results = []
-    scan_d_results = []
-    
+    # Preallocate one structured array per scan, sized by the only true
+    # upper bound (every row of every ticker is a hit); blocks of hits are
+    # written in place, so no per-row Python objects accumulate and the
+    # final DataFrames are built from already-contiguous arrays
+    capacity = max(1, sum(len(df) for df in stock_data.values()))
+
+    scan_a_out = np.empty(capacity, dtype=[('Ticker', 'U10'), ('Date', 'U10'),
+                                           ('pct', 'f8'), ('price', 'f8'), ('volume', 'u8')])
+    scan_b_out = np.empty(capacity, dtype=[('Ticker', 'U10'), ('Date', 'U10'),
+                                           ('gap', 'f8'), ('price', 'f8'), ('volume', 'u8')])
+    scan_c_out = np.empty(capacity, dtype=[('Ticker', 'U10'), ('Date', 'U10'),
+                                           ('days', 'i8'), ('price', 'f8'), ('volume', 'u8')])
+    scan_d_out = np.empty(capacity, dtype=[('Ticker', 'U10'), ('Date', 'U10'),
+                                           ('pct', 'f8'), ('volume', 'u8'), ('price', 'f8')])
+    n_a = n_b = n_c = n_d = 0
+
+    # First surge price / first breakout volume per ticker, for the
+    # combined table (mirrors the old first-match list walk)
+    first_surge_price: Dict[str, float] = {}
+    first_breakout_volume: Dict[str, int] = {}
+
     # Track which tickers meet each criterion
     tickers_with_surge = set()
     tickers_with_gap = set()
     tickers_with_uptrend = set()
     tickers_with_volume = set()
-    
+
     progress_bar = st.progress(0)
     status_text = st.empty()
-    
-    total_tickers = len(tickers)
-    
-    for i, ticker in enumerate(tickers):
+
+    # Throttle UI updates (see fetch_stock_histories)
+    ui_interval = 0.1
+    last_ui = 0.0
+
+    total_fetched = len(stock_data)
+
+    # Compute the scan-period boundary once, tz-localized against the
+    # first frame's index (all frames come from the same Yahoo feed and
+    # share a timezone), instead of re-deriving it per ticker
+    scan_start_compare = pd.Timestamp(scan_start_date)
+    if stock_data:
+        first_tz = next(iter(stock_data.values())).index.tz
+        if first_tz is not None:
+            scan_start_compare = scan_start_compare.tz_localize(first_tz)
+
+    for i, (ticker, data) in enumerate(stock_data.items()):
         # Check if stop was requested
         if st.session_state.get('stop_requested', False):
-            status_text.text(f"⏹️ Scan stopped by user at {i}/{total_tickers} stocks")
-            st.warning(f"⚠️ Scan interrupted! Processed {i} out of {total_tickers} stocks.")
+            status_text.text(f"⏹️ Scan stopped by user at {i}/{total_fetched} stocks")
+            st.warning(f"⚠️ Scan interrupted! Processed {i} out of {total_fetched} stocks.")
             break
-        
-        # Update progress
-        progress = (i + 1) / total_tickers
-        progress_bar.progress(progress)
-        status_text.text(f"Scanning {ticker}... ({i + 1}/{total_tickers})")
-        
-        # Fetch data
-        data = fetch_stock_data(ticker, start_date, end_date)
-        
-        if data is None:
-            continue
-        
-        # Filter data to scan period only for results
-        # Ensure scan_start_date is timezone-aware if data.index is timezone-aware
-        scan_start_compare = pd.Timestamp(scan_start_date)
-        if data.index.tz is not None:
-            scan_start_compare = scan_start_compare.tz_localize(data.index.tz)
-        scan_data = data[data.index >= scan_start_compare]
-        
-        # Perform scans with custom parameters
-        surge_results = scan_price_surge(scan_data, threshold=price_surge_threshold)
-        if surge_results:
+
+        # Update progress (throttled)
+        if time.monotonic() - last_ui > ui_interval or i == total_fetched - 1:
+            last_ui = time.monotonic()
+            progress_bar.progress((i + 1) / total_fetched)
+            status_text.text(f"Scanning {ticker}... ({i + 1}/{total_fetched})")
+
+        # Locate the scan-period boundary within this ticker's history;
+        # the index is sorted, so a binary search beats a boolean mask
+        scan_pos = int(data.index.searchsorted(scan_start_compare))
+
+        # Rows more than one MA window before the boundary can't affect
+        # any reported hit; trim them so the kernel walks fewer rows
+        # (matters when a cached frame carries extra history)
+        trim = max(0, scan_pos - VOLUME_MA_PERIOD)
+        if trim:
+            data = data.iloc[trim:]
+            scan_pos -= trim
+
+        # All four scans in one pass over this ticker's arrays; rows before
+        # scan_pos only feed the volume moving average. The volume scan runs
+        # first and, in combined-only mode, rules out tickers early.
+        hits = run_all_scans(
+            data, scan_pos,
+            surge_threshold=price_surge_threshold,
+            gap_threshold=upward_gap_threshold,
+            uptrend_min_days=uptrend_min_days,
+            volume_threshold=volume_breakout_threshold,
+            volume_ma_period=VOLUME_MA_PERIOD,
+            combined_only=combined_only
+        )
+
+        # Write each ticker's hits into the structured arrays as one block
+        # per scan; all string formatting is deferred to the end
+        if hits['surge']:
             tickers_with_surge.add(ticker)
-        for date, pct_change, price in surge_results:
-            scan_a_results.append({
-                'Ticker': ticker,
-                'Date': date,
-                'Price Change (%)': f"{pct_change:.2f}",
-                'Close Price': f"${price:.2f}",
-                'Volume': int(scan_data.loc[date, 'Volume']) if date in scan_data.index else 'N/A'
-            })
-        
-        gap_results = scan_upward_gap(scan_data, threshold=upward_gap_threshold)
-        if gap_results:
+            k = len(hits['surge'])
+            block = scan_a_out[n_a:n_a + k]
+            block['Ticker'] = ticker
+            (block['Date'], block['pct'],
+             block['price'], block['volume']) = zip(*hits['surge'])
+            first_surge_price.setdefault(ticker, hits['surge'][0][2])
+            n_a += k
+
+        if hits['gap']:
             tickers_with_gap.add(ticker)
-        for date, gap_pct, price in gap_results:
-            scan_b_results.append({
-                'Ticker': ticker,
-                'Date': date,
-                'Gap (%)': f"{gap_pct:.2f}",
-                'Open Price': f"${price:.2f}",
-                'Volume': int(scan_data.loc[date, 'Volume']) if date in scan_data.index else 'N/A'
-            })
-        
-        uptrend_results = scan_continuous_uptrend(scan_data, min_days=uptrend_min_days)
-        if uptrend_results:
+            k = len(hits['gap'])
+            block = scan_b_out[n_b:n_b + k]
+            block['Ticker'] = ticker
+            (block['Date'], block['gap'],
+             block['price'], block['volume']) = zip(*hits['gap'])
+            n_b += k
+
+        if hits['uptrend']:
             tickers_with_uptrend.add(ticker)
-        for date, num_days, price in uptrend_results:
-            scan_c_results.append({
-                'Ticker': ticker,
-                'End Date': date,
-                'Consecutive Days': num_days,
-                'Close Price': f"${price:.2f}",
-                'Volume': int(scan_data.loc[date, 'Volume']) if date in scan_data.index else 'N/A'
-            })
-        
-        volume_results = scan_volume_breakout(data, threshold=volume_breakout_threshold)
-        # Filter volume results to scan period
-        volume_found = False
-        for date, volume_ratio, volume in volume_results:
-            date_compare = pd.Timestamp(date)
-            if data.index.tz is not None and date_compare.tz is None:
-                date_compare = date_compare.tz_localize(data.index.tz)
-            if date_compare >= scan_start_compare:
-                volume_found = True
-                scan_d_results.append({
-                    'Ticker': ticker,
-                    'Date': date,
-                    'Volume Increase (%)': f"{volume_ratio:.2f}",
-                    'Volume': int(volume),
-                    'Price': f"${scan_data.loc[date, 'Close']:.2f}" if date in scan_data.index else 'N/A'
-                })
-        if volume_found:
+            k = len(hits['uptrend'])
+            block = scan_c_out[n_c:n_c + k]
+            block['Ticker'] = ticker
+            (block['Date'], block['days'],
+             block['price'], block['volume']) = zip(*hits['uptrend'])
+            n_c += k
+
+        if hits['volume']:
             tickers_with_volume.add(ticker)
-        
-        # Add small delay to avoid rate limiting
-        time.sleep(0.1)
-    
+            k = len(hits['volume'])
+            block = scan_d_out[n_d:n_d + k]
+            block['Ticker'] = ticker
+            (block['Date'], block['pct'],
+             block['price'], block['volume']) = zip(*hits['volume'])
+            first_breakout_volume.setdefault(ticker, int(hits['volume'][0][3]))
+            n_d += k
+
     progress_bar.empty()
     status_text.empty()
     
@@ -189,34 +488,50 @@ def perform_scans(tickers: List[str], start_date: datetime, end_date: datetime,
     # Create combined results
     combined_results = []
     for ticker in sorted(all_criteria_tickers):
-        # Get the most recent data for this ticker
-        latest_price = 'N/A'
-        latest_volume = 'N/A'
-        
-        # Try to get latest info from scan results
-        for result in scan_a_results:
-            if result['Ticker'] == ticker:
-                latest_price = result['Close Price']
-                break
-        
-        for result in scan_d_results:
-            if result['Ticker'] == ticker:
-                latest_volume = result['Volume']
-                break
-        
+        price = first_surge_price.get(ticker)
+        volume = first_breakout_volume.get(ticker)
+
         combined_results.append({
             'Ticker': ticker,
-            'Price': latest_price,
-            'Volume': latest_volume,
+            'Price': f"${price:.2f}" if price is not None else 'N/A',
+            'Volume': volume if volume is not None else 'N/A',
             'Criteria Met': 'All 4',
             'Yahoo Finance': f"https://finance.yahoo.com/quote/{ticker}"
         })
-    
+
+    # Build each result table once from the filled portion of its
+    # structured array and format the numeric columns in vectorized passes
+    df_a = pd.DataFrame(scan_a_out[:n_a])
+    df_a['Price Change (%)'] = df_a['pct'].map('{:.2f}'.format)
+    # The dollar sign lives inside the format call: on a zero-hit scan the
+    # mapped column stays float64, and '$' + <empty float64> has no ufunc
+    df_a['Close Price'] = df_a['price'].map('${:.2f}'.format)
+    df_a['Volume'] = df_a['volume'].astype('int64')
+    df_a = df_a[['Ticker', 'Date', 'Price Change (%)', 'Close Price', 'Volume']]
+
+    df_b = pd.DataFrame(scan_b_out[:n_b])
+    df_b['Gap (%)'] = df_b['gap'].map('{:.2f}'.format)
+    df_b['Open Price'] = df_b['price'].map('${:.2f}'.format)
+    df_b['Volume'] = df_b['volume'].astype('int64')
+    df_b = df_b[['Ticker', 'Date', 'Gap (%)', 'Open Price', 'Volume']]
+
+    df_c = pd.DataFrame(scan_c_out[:n_c])
+    df_c = df_c.rename(columns={'Date': 'End Date', 'days': 'Consecutive Days'})
+    df_c['Close Price'] = df_c['price'].map('${:.2f}'.format)
+    df_c['Volume'] = df_c['volume'].astype('int64')
+    df_c = df_c[['Ticker', 'End Date', 'Consecutive Days', 'Close Price', 'Volume']]
+
+    df_d = pd.DataFrame(scan_d_out[:n_d])
+    df_d['Volume Increase (%)'] = df_d['pct'].map('{:.2f}'.format)
+    df_d['Volume'] = df_d['volume'].astype('int64')
+    df_d['Price'] = df_d['price'].map('${:.2f}'.format)
+    df_d = df_d[['Ticker', 'Date', 'Volume Increase (%)', 'Volume', 'Price']]
+
     return {
-        f'Scan A: Price Surge (>{price_surge_threshold*100:.1f}%)': pd.DataFrame(scan_a_results),
-        f'Scan B: Upward Gap (>{upward_gap_threshold*100:.1f}%)': pd.DataFrame(scan_b_results),
-        f'Scan C: Continuous Uptrend (≥{uptrend_min_days} days)': pd.DataFrame(scan_c_results),
-        f'Scan D: Volume Breakout (>{volume_breakout_threshold*100:.0f}%)': pd.DataFrame(scan_d_results),
+        f'Scan A: Price Surge (>{price_surge_threshold*100:.1f}%)': df_a,
+        f'Scan B: Upward Gap (>{upward_gap_threshold*100:.1f}%)': df_b,
+        f'Scan C: Continuous Uptrend (≥{uptrend_min_days} days)': df_c,
+        f'Scan D: Volume Breakout (>{volume_breakout_threshold*100:.0f}%)': df_d,
         'Combined: All 4 Criteria': pd.DataFrame(combined_results)
     }
 
@@ -329,7 +644,16 @@ def main():
             step=5.0,
             help="Minimum volume increase above 50-day average (default: 10%)"
         )
-        
+
+        # Fast path for users who only care about the premium picks
+        combined_only = st.checkbox(
+            "⚡ Combined only (fast)",
+            value=False,
+            help="Skip the price scans on tickers without a volume breakout. "
+                 "Faster, but the Scan A/B/C tabs then only show tickers that "
+                 "also passed the volume filter."
+        )
+
         st.markdown("---")
         
         # Scan button
@@ -360,7 +684,7 @@ def main():
         
         # Get tickers
         st.info(f"Fetching {market} tickers...")
-        tickers = get_tickers_by_market(market)
+        tickers = _cached_tickers(market)
         
         if not tickers:
             st.error("No tickers found for the selected market.")
@@ -390,31 +714,38 @@ def main():
                 st.info(f"   Filtered from {original_count} to {len(tickers)} tickers")
         
         st.success(f"✓ Found {len(tickers)} tickers to scan")
-        
+
         # Display date range
         st.info(f"📅 Scan Period: {scan_start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
         st.info(f"📊 Data Fetch Period: {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')} (includes 55-day buffer)")
-        
-        # Perform scans with user-defined parameters
-        st.subheader("Scanning in Progress...")
+
+        # Fetch the histories (the slow, network-bound stage) and keep them
+        # in session state; the scan stage below re-runs from this cache on
+        # every rerun, so threshold tweaks never trigger a re-download
+        st.subheader("Fetching Stock Data...")
+        st.session_state.stock_data = fetch_stock_histories(tickers, start_date, end_date)
+        st.session_state.scan_start_date = scan_start_date
+
+        # Reset scanning state
+        st.session_state.scanning = False
+        st.session_state.stop_requested = False
+
+    if 'stock_data' in st.session_state:
+        # Scan stage: pure compute over cached histories, recomputed with
+        # the current widget values on every rerun (cheap relative to fetch)
         results = perform_scans(
-            tickers, 
-            start_date, 
-            end_date, 
-            scan_start_date,
+            st.session_state.stock_data,
+            st.session_state.scan_start_date,
             price_surge_threshold=price_surge_pct / 100,  # Convert % to decimal
             upward_gap_threshold=upward_gap_pct / 100,    # Convert % to decimal
             uptrend_min_days=uptrend_days,
-            volume_breakout_threshold=volume_breakout_pct / 100  # Convert % to decimal
+            volume_breakout_threshold=volume_breakout_pct / 100,  # Convert % to decimal
+            combined_only=combined_only
         )
-        
-        # Reset scanning state
-        st.session_state.scanning = False
-        st.session_state.stop_requested = False
-        
+
         # Display results
         st.success("✅ Scan Complete!")
-        
+
         # Summary statistics
         st.subheader("📊 Summary Statistics")
         col1, col2, col3, col4, col5 = st.columns(5)
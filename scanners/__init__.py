@@ -7,19 +7,33 @@ This package contains four independent scanning modules:
 - scan_continuous_uptrend: Scan C - Continuous Uptrend (≥4 days)
 - scan_volume_breakout: Scan D - Volume Breakout
 
-Each module can be imported and used independently.
+Each module can be imported and used independently. The fused module
+runs all four scans in a single pass over one ticker's data and is what
+the Streamlit app uses.
+
+All scanners treat the input DataFrame as read-only: they pull columns
+out with to_numpy() and never assign back, so callers can safely share
+one frame (or a slice of one) across several scans.
 """
 
 from .scan_price_surge import scan_price_surge
-from .scan_upward_gap import scan_upward_gap
+from .scan_upward_gap import scan_upward_gap, scan_upward_gap_array
 from .scan_continuous_uptrend import scan_continuous_uptrend
-from .scan_volume_breakout import scan_volume_breakout
+from .scan_volume_breakout import scan_volume_breakout, scan_volume_breakout_array
+from .fused import run_all_scans
+from .batch import scan_upward_gap_batch, scan_volume_breakout_batch, scan_panel
 
 __all__ = [
     'scan_price_surge',
     'scan_upward_gap',
     'scan_continuous_uptrend',
-    'scan_volume_breakout'
+    'scan_volume_breakout',
+    'run_all_scans',
+    'scan_upward_gap_array',
+    'scan_volume_breakout_array',
+    'scan_upward_gap_batch',
+    'scan_volume_breakout_batch',
+    'scan_panel'
 ]
 
 __version__ = '1.0.0'
@@ -0,0 +1,42 @@
+"""
+Shared date-string cache for the scanner modules.
+
+Every scanner formats hit dates as '%Y-%m-%d'. For one ticker the
+formatted strings are identical across all four scans and across
+threshold sweeps, so the full index is formatted once and memoized,
+keyed on the raw int64 timestamps plus timezone (exact — two indexes
+share an entry only if they are element-for-element equal).
+"""
+
+import functools
+
+import numpy as np
+import pandas as pd
+
+
+def date_strings(index: pd.DatetimeIndex) -> np.ndarray:
+    """
+    Return the '%Y-%m-%d' strings for index, cached per distinct index.
+
+    The cached array is shared between callers and must be treated as
+    read-only; index it with hit positions rather than slicing views
+    that are later written to.
+    """
+    try:
+        values = index.values
+        return _date_strings_cached(values.tobytes(), values.dtype.str,
+                                    str(index.tz))
+    except Exception:
+        # Unhashable/unconvertible timezone object — format directly
+        return index.strftime('%Y-%m-%d').to_numpy()
+
+
+@functools.lru_cache(maxsize=2048)
+def _date_strings_cached(ts_bytes: bytes, dtype_str: str, tz_key: str) -> np.ndarray:
+    # index.values holds naive UTC timestamps for tz-aware indexes, so
+    # rebuild the wall-clock dates by localizing and converting back
+    stamps = np.frombuffer(ts_bytes, dtype=dtype_str)
+    idx = pd.DatetimeIndex(stamps)
+    if tz_key != 'None':
+        idx = idx.tz_localize('UTC').tz_convert(tz_key)
+    return idx.strftime('%Y-%m-%d').to_numpy()
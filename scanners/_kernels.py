@@ -0,0 +1,145 @@
+"""
+Numba-compiled inner kernels for the scanner modules.
+
+Each kernel does a single forward pass over a NumPy array with a
+preallocated output buffer, so the per-ticker cost is one machine-code
+call with no temporary arrays. When numba is not installed the kernels
+fall back to plain Python functions, which keeps the scanners working
+(just without the compiled speedup).
+"""
+
+import functools
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is unavailable."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+
+        return wrap
+
+
+@njit(cache=True)
+def _rolling_mean_np(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    O(n) rolling mean via a running sum, NaN-aware.
+
+    Returns an array the same length as values with the window-day mean
+    ending at each position; positions whose window is incomplete or
+    contains a NaN get NaN (matching pandas' rolling(...).mean()).
+    fastmath is deliberately off: it would let LLVM assume no NaNs and
+    break the invalidation tracking.
+    """
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+
+    running = 0.0
+    nan_count = 0
+    for i in range(n):
+        v = values[i]
+        if np.isnan(v):
+            nan_count += 1
+        else:
+            running += v
+        if i >= window:
+            old = values[i - window]
+            if np.isnan(old):
+                nan_count -= 1
+            else:
+                running -= old
+        if i >= window - 1 and nan_count == 0:
+            out[i] = running / window
+
+    return out
+
+
+@functools.lru_cache(maxsize=32)
+def make_surge_kernel(threshold_pct: float):
+    """
+    Return a surge kernel with threshold_pct baked in as a constant.
+
+    The kernel finds days where the close-to-close change exceeds
+    threshold_pct percent and returns (indices, pct_changes) trimmed to
+    the number of hits. The threshold is fixed for a whole scan run, so
+    closing over it lets LLVM fold the comparison into an immediate
+    instead of loading an argument per call. The factory is lru_cached
+    so each distinct threshold compiles once per process. (Disk caching
+    is unavailable for closures, hence no cache=True here.)
+    """
+    threshold_pct = float(threshold_pct)
+
+    @njit
+    def kernel(close):
+        n = close.shape[0]
+        idx = np.empty(n, dtype=np.int64)
+        pct = np.empty(n, dtype=np.float64)
+
+        k = 0
+        for i in range(1, n):
+            change = (close[i] / close[i - 1] - 1.0) * 100.0
+            if change > threshold_pct:
+                idx[k] = i
+                pct[k] = change
+                k += 1
+
+        return idx[:k], pct[:k]
+
+    return kernel
+
+
+@functools.lru_cache(maxsize=32)
+def make_uptrend_kernel(min_days: int):
+    """
+    Return an uptrend kernel with min_days baked in as a constant.
+
+    The kernel finds days ending a streak of >= min_days consecutive
+    higher closes and returns (indices, streak_lengths) trimmed to the
+    number of hits; streak lengths count the day that started the run.
+    Same specialization rationale as make_surge_kernel.
+    """
+    min_days = int(min_days)
+
+    @njit
+    def kernel(close):
+        n = close.shape[0]
+        idx = np.empty(n, dtype=np.int64)
+        length = np.empty(n, dtype=np.int64)
+
+        k = 0
+        streak = 1
+        for i in range(1, n):
+            if close[i] > close[i - 1]:
+                streak += 1
+                if streak >= min_days:
+                    idx[k] = i
+                    length[k] = streak
+                    k += 1
+            else:
+                streak = 1
+
+        return idx[:k], length[:k]
+
+    return kernel
+
+
+def _warm_up():
+    """Trigger JIT compilation once at import so scan loops never pay it."""
+    tiny = np.array([1.0, 2.0, 3.0])
+    make_surge_kernel(5.0)(tiny)
+    make_uptrend_kernel(4)(tiny)
+    _rolling_mean_np(tiny, 2)
+
+
+if NUMBA_AVAILABLE:
+    _warm_up()
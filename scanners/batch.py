@@ -0,0 +1,177 @@
+"""
+Batch Scanners
+2-D variants of the gap and volume scans that operate on a whole
+universe at once: tickers stacked as rows, trading days as columns.
+
+Stacking pays the per-ticker Python/pandas overhead once instead of
+thousands of times; each scan is then a single vectorized expression
+over the panel. Histories of different lengths must be padded to a
+common width with NaN (pad at the front so the last column is the most
+recent day) — padded positions never produce hits, because NaN fails
+every comparison and invalidates any moving-average window it touches.
+
+The per-ticker scan_* functions remain the standalone API; they also
+materialize dates and prices, which a raw panel has no index for, so
+they are kept as independent implementations rather than shims over
+this module.
+"""
+
+import numpy as np
+
+from ._kernels import njit, prange, NUMBA_AVAILABLE
+
+
+def scan_upward_gap_batch(opens: np.ndarray, closes: np.ndarray,
+                          threshold: float = 0.01) -> np.ndarray:
+    """
+    Find upward gaps across a whole panel in one pass.
+
+    Args:
+        opens: 2-D array of open prices, shape (tickers, days)
+        closes: 2-D array of close prices, same shape
+        threshold: Gap threshold (default 0.01 = 1%)
+
+    Returns:
+        Array of (ticker_idx, day_idx) pairs, shape (hits, 2), where
+        day_idx is the day that gapped up from the previous close
+    """
+    if opens.shape[1] < 2:
+        return np.empty((0, 2), dtype=np.int64)
+
+    with np.errstate(invalid='ignore'):
+        mask = opens[:, 1:] > closes[:, :-1] * (1 + threshold)
+
+    hits = np.argwhere(mask)
+    hits[:, 1] += 1
+    return hits
+
+
+def scan_volume_breakout_batch(volumes: np.ndarray, threshold: float = 0.10,
+                               ma_period: int = 50) -> np.ndarray:
+    """
+    Find volume breakouts across a whole panel in one pass.
+
+    Uses the same running-sum rolling mean as the per-ticker scanner,
+    computed row-wise with cumulative sums; windows containing NaN
+    (including any front padding) are invalidated.
+
+    Args:
+        volumes: 2-D array of volumes, shape (tickers, days)
+        threshold: Volume threshold above the moving average (default 0.10)
+        ma_period: Moving average period in days (default 50)
+
+    Returns:
+        Array of (ticker_idx, day_idx) pairs, shape (hits, 2); day
+        indices start at ma_period, matching the per-ticker scanner
+    """
+    n_tickers, n_days = volumes.shape
+    if n_days <= ma_period:
+        return np.empty((0, 2), dtype=np.int64)
+
+    volumes = volumes.astype(np.float64, copy=False)
+    nan_flags = np.isnan(volumes)
+
+    zeros = np.zeros((n_tickers, 1))
+    cs = np.concatenate([zeros, np.cumsum(np.where(nan_flags, 0.0, volumes), axis=1)], axis=1)
+    cs_nan = np.concatenate([zeros, np.cumsum(nan_flags, axis=1)], axis=1)
+
+    avg = (cs[:, ma_period + 1:] - cs[:, 1:-ma_period]) / ma_period
+    # Validity spans ma_period + 1 trailing positions (the window plus
+    # the day before it): the per-ticker scanner skips the first full
+    # window of a history, so on a front-padded row the first checked
+    # day must be first_valid + ma_period, not first_valid + ma_period - 1
+    window_valid = (cs_nan[:, ma_period + 1:] - cs_nan[:, :-(ma_period + 1)]) == 0
+
+    checked = volumes[:, ma_period:]
+    with np.errstate(invalid='ignore'):
+        mask = window_valid & (checked > avg * (1 + threshold))
+
+    hits = np.argwhere(mask)
+    hits[:, 1] += ma_period
+    return hits
+
+
+@njit(parallel=True, cache=True)
+def _scan_panel_kernel(opens, closes, volumes, gap_threshold, vol_threshold,
+                       ma_period):
+    """
+    Gap and volume-breakout masks for a whole panel in one compiled pass.
+
+    Tickers are independent, so the outer loop runs under prange with
+    the GIL released; each row's running volume sum stays in cache. The
+    running sum accumulates in float64 and tracks NaN counts the same
+    way as _rolling_mean_np (no fastmath for that reason).
+    """
+    n_tickers, n_days = closes.shape
+    gap_mask = np.zeros((n_tickers, n_days), dtype=np.bool_)
+    vol_mask = np.zeros((n_tickers, n_days), dtype=np.bool_)
+
+    for t in prange(n_tickers):
+        for i in range(1, n_days):
+            if opens[t, i] > closes[t, i - 1] * (1.0 + gap_threshold):
+                gap_mask[t, i] = True
+
+        running = 0.0
+        nan_count = 0
+        for i in range(n_days):
+            v = volumes[t, i]
+            if np.isnan(v):
+                nan_count += 1
+            else:
+                running += v
+            if i >= ma_period:
+                old = volumes[t, i - ma_period]
+                old_is_nan = np.isnan(old)
+                if old_is_nan:
+                    nan_count -= 1
+                else:
+                    running -= old
+                # The day before the window must also be in-row: the
+                # per-ticker scanner skips a history's first complete
+                # window, so a front-padded row's first checked day is
+                # first_valid + ma_period (same rule as the vectorized
+                # batch scan's validity mask)
+                if nan_count == 0 and not old_is_nan:
+                    avg = running / ma_period
+                    if v > avg * (1.0 + vol_threshold):
+                        vol_mask[t, i] = True
+
+    return gap_mask, vol_mask
+
+
+def scan_panel(opens: np.ndarray, closes: np.ndarray, volumes: np.ndarray,
+               gap_threshold: float = 0.01, vol_threshold: float = 0.10,
+               ma_period: int = 50):
+    """
+    Run the gap and volume scans over a whole panel in one sweep.
+
+    With numba available this is a single parallel kernel over all
+    tickers; otherwise it falls back to the vectorized per-scan batch
+    functions above. Same NaN-padding rules as those functions.
+
+    Args:
+        opens, closes, volumes: 2-D arrays, shape (tickers, days)
+        gap_threshold: Upward gap threshold (default 0.01 = 1%)
+        vol_threshold: Volume-above-average threshold (default 0.10 = 10%)
+        ma_period: Volume moving average period in days (default 50)
+
+    Returns:
+        Tuple (gap_hits, volume_hits) of (ticker_idx, day_idx) pair arrays,
+        matching scan_upward_gap_batch / scan_volume_breakout_batch
+    """
+    if not NUMBA_AVAILABLE:
+        return (scan_upward_gap_batch(opens, closes, gap_threshold),
+                scan_volume_breakout_batch(volumes, vol_threshold, ma_period))
+
+    gap_mask, vol_mask = _scan_panel_kernel(
+        opens, closes, volumes.astype(np.float64, copy=False),
+        gap_threshold, vol_threshold, ma_period
+    )
+    return np.argwhere(gap_mask), np.argwhere(vol_mask)
+
+
+if NUMBA_AVAILABLE:
+    # Warm the JIT once at import so panel sweeps never pay compile cost
+    _tiny = np.ones((1, 3))
+    _scan_panel_kernel(_tiny, _tiny, _tiny, 0.01, 0.1, 2)
+    del _tiny
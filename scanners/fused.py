@@ -0,0 +1,174 @@
+"""
+Fused Scanner
+Runs all four scans (price surge, upward gap, continuous uptrend, volume
+breakout) in a single pass over one ticker's OHLCV arrays.
+
+The per-scan modules are still available for standalone use; this module
+exists for the orchestrator, which previously walked each ticker's
+DataFrame four times (re-materializing columns and re-checking timezones
+every time).
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Tuple
+
+from ._dates import date_strings
+from ._kernels import njit, NUMBA_AVAILABLE
+
+
+@njit(cache=True)
+def _fused_kernel(open_, close, volume, scan_pos, surge_pct, gap_threshold,
+                  uptrend_min_days, volume_threshold, volume_ma_period,
+                  require_volume):
+    """
+    Extract all four signals from one ticker's arrays in a single pass.
+
+    The price-based scans (surge, gap, uptrend) only consider rows inside
+    the scan window (index >= scan_pos), with the uptrend streak starting
+    fresh at the window boundary — matching the old behavior of running
+    those scanners on the sliced frame. The volume scan uses the full
+    buffered history for its moving average but only reports hits inside
+    the window.
+
+    The volume scan runs first; when require_volume is set and it finds
+    nothing, the price scans are skipped entirely, since a ticker
+    without a volume breakout can never reach the all-four-criteria set.
+
+    Returns index/metric arrays for each scan, trimmed to the hit counts.
+    """
+    n = close.shape[0]
+
+    surge_idx = np.empty(n, dtype=np.int64)
+    surge_val = np.empty(n, dtype=np.float64)
+    gap_idx = np.empty(n, dtype=np.int64)
+    gap_val = np.empty(n, dtype=np.float64)
+    up_idx = np.empty(n, dtype=np.int64)
+    up_len = np.empty(n, dtype=np.int64)
+    vol_idx = np.empty(n, dtype=np.int64)
+    vol_val = np.empty(n, dtype=np.float64)
+
+    n_surge = n_gap = n_up = n_vol = 0
+
+    # Volume scan: running-sum moving average over the buffered history
+    if n >= volume_ma_period:
+        window_sum = 0.0
+        for i in range(volume_ma_period):
+            window_sum += volume[i]
+
+        for i in range(volume_ma_period, n):
+            # Add and subtract separately so unsigned volume dtypes
+            # never underflow before the float accumulation
+            window_sum = window_sum + volume[i]
+            window_sum = window_sum - volume[i - volume_ma_period]
+            if i >= scan_pos:
+                avg = window_sum / volume_ma_period
+                if volume[i] > avg * (1.0 + volume_threshold):
+                    vol_idx[n_vol] = i
+                    vol_val[n_vol] = (volume[i] / avg - 1.0) * 100.0
+                    n_vol += 1
+
+    # Price-based scans: one walk over the scan window, skipped when the
+    # volume pre-filter already ruled this ticker out
+    if not (require_volume and n_vol == 0):
+        streak = 1
+        for i in range(scan_pos + 1, n):
+            prev_close = close[i - 1]
+
+            change = (close[i] / prev_close - 1.0) * 100.0
+            if change > surge_pct:
+                surge_idx[n_surge] = i
+                surge_val[n_surge] = change
+                n_surge += 1
+
+            if open_[i] > prev_close * (1.0 + gap_threshold):
+                gap_idx[n_gap] = i
+                gap_val[n_gap] = (open_[i] - prev_close) / prev_close * 100.0
+                n_gap += 1
+
+            if close[i] > prev_close:
+                streak += 1
+                if streak >= uptrend_min_days:
+                    up_idx[n_up] = i
+                    up_len[n_up] = streak
+                    n_up += 1
+            else:
+                streak = 1
+
+    return (surge_idx[:n_surge], surge_val[:n_surge],
+            gap_idx[:n_gap], gap_val[:n_gap],
+            up_idx[:n_up], up_len[:n_up],
+            vol_idx[:n_vol], vol_val[:n_vol])
+
+
+def run_all_scans(data: pd.DataFrame, scan_pos: int = 0,
+                  surge_threshold: float = 0.05,
+                  gap_threshold: float = 0.01,
+                  uptrend_min_days: int = 4,
+                  volume_threshold: float = 0.10,
+                  volume_ma_period: int = 50,
+                  combined_only: bool = False) -> Dict[str, List[Tuple]]:
+    """
+    Run all four scans on one ticker's data with a single array pass.
+
+    Args:
+        data: Full buffered OHLCV DataFrame for one ticker
+        scan_pos: Integer position where the scan window starts; rows
+            before it only feed the volume moving average
+        surge_threshold: Price surge threshold (0.05 = 5%)
+        gap_threshold: Upward gap threshold (0.01 = 1%)
+        uptrend_min_days: Minimum consecutive higher closes
+        volume_threshold: Volume-above-average threshold (0.10 = 10%)
+        volume_ma_period: Volume moving average window in days
+        combined_only: Skip the price scans on tickers with no volume
+            breakout (they can never meet all four criteria)
+
+    Returns:
+        Dictionary with keys 'surge', 'gap', 'uptrend', 'volume'; each
+        value is a list of 4-tuples matching the corresponding scan_*
+        function's return shape.
+    """
+    empty = {'surge': [], 'gap': [], 'uptrend': [], 'volume': []}
+
+    if len(data) < 2:
+        return empty
+
+    # Keep the columns' native dtypes (float32/uint64 after the app's
+    # downcast) so the kernel streams half the bytes; numba compiles a
+    # specialization per dtype combination
+    open_ = data['Open'].to_numpy()
+    close = data['Close'].to_numpy()
+    volume = data['Volume'].to_numpy()
+
+    (surge_idx, surge_val, gap_idx, gap_val,
+     up_idx, up_len, vol_idx, vol_val) = _fused_kernel(
+        open_, close, volume, scan_pos,
+        surge_threshold * 100, gap_threshold,
+        uptrend_min_days, volume_threshold, volume_ma_period,
+        combined_only
+    )
+
+    # One cached '%Y-%m-%d' array serves all four scans (and repeat
+    # scans of the same frame, e.g. threshold sweeps)
+    dates = date_strings(data.index)
+    return {
+        'surge': list(zip(dates[surge_idx].tolist(),
+                          surge_val.tolist(), close[surge_idx].tolist(),
+                          volume[surge_idx].tolist())),
+        'gap': list(zip(dates[gap_idx].tolist(),
+                        gap_val.tolist(), open_[gap_idx].tolist(),
+                        volume[gap_idx].tolist())),
+        'uptrend': list(zip(dates[up_idx].tolist(),
+                            up_len.tolist(), close[up_idx].tolist(),
+                            volume[up_idx].tolist())),
+        'volume': list(zip(dates[vol_idx].tolist(),
+                           vol_val.tolist(), close[vol_idx].tolist(),
+                           volume[vol_idx].tolist())),
+    }
+
+
+if NUMBA_AVAILABLE:
+    # Warm the JIT once at import so scan loops never pay compile cost
+    _tiny = np.array([1.0, 2.0, 3.0])
+    _fused_kernel(_tiny, _tiny, _tiny, 0, 5.0, 0.01, 2, 0.1, 2, False)
+    del _tiny
@@ -6,68 +6,66 @@ Identifies stocks with consecutive days of higher closes (default 4+ days)
 import pandas as pd
 from typing import List, Tuple
 
+from ._dates import date_strings
+from ._kernels import make_uptrend_kernel
 
-def scan_continuous_uptrend(data: pd.DataFrame, min_days: int = 4) -> List[Tuple[str, int, float]]:
+
+def scan_continuous_uptrend(data: pd.DataFrame, min_days: int = 4) -> List[Tuple[str, int, float, int]]:
     """
     Scan for continuous uptrends (consecutive days with higher closes).
-    
+
     Args:
         data: Stock price data with OHLCV columns
         min_days: Minimum consecutive days (default 4)
-    
+
     Returns:
-        List of tuples (end_date, num_days, end_price)
+        List of tuples (end_date, num_days, end_price, volume)
         Each tuple represents the end of an uptrend sequence
-    
+
     Example:
         >>> data = yf.download('NVDA', period='1mo')
         >>> results = scan_continuous_uptrend(data, min_days=4)
-        >>> for date, days, price in results:
+        >>> for date, days, price, volume in results:
         ...     print(f"{date}: {days} days uptrend, ended at ${price:.2f}")
     """
-    results = []
-    
     if len(data) < min_days:
-        return results
-    
-    consecutive_days = 1
-    
-    for idx in range(1, len(data)):
-        if data['Close'].iloc[idx] > data['Close'].iloc[idx - 1]:
-            consecutive_days += 1
-            
-            if consecutive_days >= min_days:
-                date = data.index[idx].strftime('%Y-%m-%d')
-                close_price = data['Close'].iloc[idx]
-                results.append((date, consecutive_days, close_price))
-        else:
-            consecutive_days = 1
-    
-    return results
+        return []
 
+    close = data['Close'].to_numpy()
+    volume = data['Volume'].to_numpy()
 
-def format_results(results: List[Tuple[str, int, float]], ticker: str) -> List[dict]:
+    # Single compiled pass tracking the running streak of higher closes,
+    # specialized for this min_days
+    idx, streak = make_uptrend_kernel(min_days)(close)
+
+    dates = date_strings(data.index)[idx]
+    return list(zip(dates.tolist(), streak.tolist(), close[idx].tolist(), volume[idx].tolist()))
+
+
+def format_results(results: List[Tuple[str, int, float, int]], ticker: str) -> List[dict]:
     """
     Format scan results into a dictionary structure for display.
-    
+
     Args:
         results: List of tuples from scan_continuous_uptrend()
         ticker: Stock ticker symbol
-    
+
     Returns:
         List of dictionaries with formatted data
     """
-    formatted = []
-    
-    for date, num_days, close_price in results:
-        formatted.append({
-            'Ticker': ticker,
-            'End Date': date,
-            'Consecutive Days': num_days,
-            'Close Price': f"${close_price:.2f}"
-        })
-    
-    return formatted
+    if not results:
+        return []
+
+    # Build one frame from the tuples and format each column in a
+    # vectorized pass instead of per-row f-strings
+    df = pd.DataFrame(results, columns=['Date', 'days', 'price', 'volume'])
+    return pd.DataFrame({
+        'Ticker': ticker,
+        'End Date': df['Date'],
+        'Consecutive Days': df['days'].astype('int64'),
+        'Close Price': '$' + df['price'].map('{:.2f}'.format),
+        'Volume': df['volume'].astype('int64'),
+    }).to_dict('records')
 
 
 def get_description() -> str:
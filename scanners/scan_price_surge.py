@@ -6,67 +6,66 @@ Identifies stocks with single-day price increases exceeding a threshold (default
 import pandas as pd
 from typing import List, Tuple
 
+from ._dates import date_strings
+from ._kernels import make_surge_kernel
 
-def scan_price_surge(data: pd.DataFrame, threshold: float = 0.05) -> List[Tuple[str, float, float]]:
+
+def scan_price_surge(data: pd.DataFrame, threshold: float = 0.05) -> List[Tuple[str, float, float, int]]:
     """
     Scan for single-day price surges exceeding threshold.
-    
+
     Args:
         data: Stock price data with OHLCV columns
         threshold: Minimum price change threshold (default 0.05 = 5%)
-    
+
     Returns:
-        List of tuples (date, pct_change, close_price)
+        List of tuples (date, pct_change, close_price, volume)
         Each tuple represents a day where price increased > threshold
-    
+
     Example:
         >>> data = yf.download('AAPL', period='1mo')
         >>> results = scan_price_surge(data, threshold=0.05)
-        >>> for date, pct_change, price in results:
+        >>> for date, pct_change, price, volume in results:
         ...     print(f"{date}: +{pct_change:.2f}% at ${price:.2f}")
     """
-    results = []
-    
     if len(data) < 2:
-        return results
-    
-    # Calculate daily percentage change
-    data['PctChange'] = data['Close'].pct_change() * 100
-    
-    # Find days where change exceeds threshold
-    for idx in range(1, len(data)):
-        pct_change = data['PctChange'].iloc[idx]
-        
-        if pct_change > (threshold * 100):
-            date = data.index[idx].strftime('%Y-%m-%d')
-            close_price = data['Close'].iloc[idx]
-            results.append((date, pct_change, close_price))
-    
-    return results
+        return []
 
+    close = data['Close'].to_numpy()
+    volume = data['Volume'].to_numpy()
 
-def format_results(results: List[Tuple[str, float, float]], ticker: str) -> List[dict]:
+    # Single compiled pass over the Close array, specialized for this
+    # threshold; the caller's DataFrame is never modified
+    idx, pct = make_surge_kernel(threshold * 100)(close)
+
+    dates = date_strings(data.index)[idx]
+    return list(zip(dates.tolist(), pct.tolist(), close[idx].tolist(), volume[idx].tolist()))
+
+
+def format_results(results: List[Tuple[str, float, float, int]], ticker: str) -> List[dict]:
     """
     Format scan results into a dictionary structure for display.
-    
+
     Args:
         results: List of tuples from scan_price_surge()
         ticker: Stock ticker symbol
-    
+
     Returns:
         List of dictionaries with formatted data
     """
-    formatted = []
-    
-    for date, pct_change, price in results:
-        formatted.append({
-            'Ticker': ticker,
-            'Date': date,
-            'Price Change (%)': f"{pct_change:.2f}",
-            'Close Price': f"${price:.2f}"
-        })
-    
-    return formatted
+    if not results:
+        return []
+
+    # Build one frame from the tuples and format each column in a
+    # vectorized pass instead of per-row f-strings
+    df = pd.DataFrame(results, columns=['Date', 'pct', 'price', 'volume'])
+    return pd.DataFrame({
+        'Ticker': ticker,
+        'Date': df['Date'],
+        'Price Change (%)': df['pct'].map('{:.2f}'.format),
+        'Close Price': '$' + df['price'].map('{:.2f}'.format),
+        'Volume': df['volume'].astype('int64'),
+    }).to_dict('records')
 
 
 def get_description() -> str:
@@ -3,67 +3,116 @@ Scan B: Upward Gap Scanner
 Identifies stocks that opened more than a threshold above previous close (default 1%)
 """
 
+import numpy as np
 import pandas as pd
 from typing import List, Tuple
 
+from ._dates import date_strings
 
-def scan_upward_gap(data: pd.DataFrame, threshold: float = 0.01) -> List[Tuple[str, float, float]]:
+# Column-oriented result layout: one contiguous field per column instead
+# of a ~100-byte tuple object per hit
+GAP_DTYPE = np.dtype([('date', 'U10'), ('gap_pct', 'f8'),
+                      ('open', 'f8'), ('volume', 'i8')])
+
+
+def scan_upward_gap_array(data: pd.DataFrame, threshold: float = 0.01) -> np.ndarray:
+    """
+    Scan for upward gaps, returning a structured ndarray.
+
+    Same scan as scan_upward_gap but the hits come back as a structured
+    array with fields (date, gap_pct, open, volume), so downstream code
+    can format, concatenate or write them without re-iterating in Python.
+
+    Args:
+        data: Stock price data with OHLCV columns
+        threshold: Gap threshold (default 0.01 = 1%)
+
+    Returns:
+        Structured ndarray of dtype GAP_DTYPE, one record per gap day
+    """
+    if len(data) < 2:
+        return np.empty(0, dtype=GAP_DTYPE)
+
+    # float32 halves the bytes streamed per row and is far more precision
+    # than a percent-threshold comparison needs; no copy is made when the
+    # caller (e.g. the app's downcast) already holds float32 columns
+    opens = data['Open'].to_numpy(dtype=np.float32, copy=False)
+    close = data['Close'].to_numpy(dtype=np.float32, copy=False)
+    volume = data['Volume'].to_numpy()
+
+    # Early exit: if even the highest open never clears the lowest
+    # previous close by the threshold, no row can match. (NaNs poison
+    # max/min into NaN, which fails the comparison and falls through.)
+    if opens[1:].max() <= close[:-1].min() * (1 + threshold):
+        return np.empty(0, dtype=GAP_DTYPE)
+
+    # Compare each open against the previous close in one array pass
+    prev_close = close[:-1]
+    with np.errstate(invalid='ignore'):
+        mask = opens[1:] > prev_close * (1 + threshold)
+    idx = np.nonzero(mask)[0] + 1
+
+    # A missing volume on a hit day becomes 0 rather than an undefined
+    # NaN-to-int cast
+    vol_hits = volume[idx]
+    if vol_hits.dtype.kind == 'f':
+        vol_hits = np.nan_to_num(vol_hits)
+
+    out = np.empty(len(idx), dtype=GAP_DTYPE)
+    out['date'] = date_strings(data.index)[idx]
+    out['gap_pct'] = (opens[idx] - close[idx - 1]) / close[idx - 1] * 100
+    out['open'] = opens[idx]
+    out['volume'] = vol_hits
+    return out
+
+
+def scan_upward_gap(data: pd.DataFrame, threshold: float = 0.01) -> List[Tuple[str, float, float, int]]:
     """
     Scan for upward gaps where open > previous close * (1 + threshold).
-    
+
     Args:
         data: Stock price data with OHLCV columns
         threshold: Gap threshold (default 0.01 = 1%)
-    
+
     Returns:
-        List of tuples (date, gap_pct, open_price)
+        List of tuples (date, gap_pct, open_price, volume)
         Each tuple represents a day with an upward gap
-    
+
     Example:
         >>> data = yf.download('TSLA', period='1mo')
         >>> results = scan_upward_gap(data, threshold=0.01)
-        >>> for date, gap_pct, price in results:
+        >>> for date, gap_pct, price, volume in results:
         ...     print(f"{date}: Gap up {gap_pct:.2f}% at ${price:.2f}")
     """
-    results = []
-    
-    if len(data) < 2:
-        return results
-    
-    for idx in range(1, len(data)):
-        prev_close = data['Close'].iloc[idx - 1]
-        curr_open = data['Open'].iloc[idx]
-        
-        if curr_open > prev_close * (1 + threshold):
-            date = data.index[idx].strftime('%Y-%m-%d')
-            gap_pct = ((curr_open - prev_close) / prev_close) * 100
-            results.append((date, gap_pct, curr_open))
-    
-    return results
+    # Backwards-compat wrapper: tolist() on a structured array yields
+    # the historical list-of-tuples shape with native Python scalars
+    return scan_upward_gap_array(data, threshold).tolist()
 
 
-def format_results(results: List[Tuple[str, float, float]], ticker: str) -> List[dict]:
+def format_results(results: List[Tuple[str, float, float, int]], ticker: str) -> List[dict]:
     """
     Format scan results into a dictionary structure for display.
-    
+
     Args:
         results: List of tuples from scan_upward_gap()
         ticker: Stock ticker symbol
-    
+
     Returns:
         List of dictionaries with formatted data
     """
-    formatted = []
-    
-    for date, gap_pct, open_price in results:
-        formatted.append({
-            'Ticker': ticker,
-            'Date': date,
-            'Gap (%)': f"{gap_pct:.2f}",
-            'Open Price': f"${open_price:.2f}"
-        })
-    
-    return formatted
+    if not results:
+        return []
+
+    # Build one frame from the tuples and format each column in a
+    # vectorized pass instead of per-row f-strings
+    df = pd.DataFrame(results, columns=['Date', 'gap', 'price', 'volume'])
+    return pd.DataFrame({
+        'Ticker': ticker,
+        'Date': df['Date'],
+        'Gap (%)': df['gap'].map('{:.2f}'.format),
+        'Open Price': '$' + df['price'].map('{:.2f}'.format),
+        'Volume': df['volume'].astype('int64'),
+    }).to_dict('records')
 
 
 def get_description() -> str:
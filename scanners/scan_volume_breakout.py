@@ -3,73 +3,142 @@ Scan D: Volume Breakout Scanner
 Identifies stocks with volume exceeding threshold above their moving average (default 10% above 50-day MA)
 """
 
+import functools
+
+import numpy as np
 import pandas as pd
 from typing import List, Tuple
 
+from ._dates import date_strings
+from ._kernels import _rolling_mean_np
+
+# Column-oriented result layout: one contiguous field per column instead
+# of a ~100-byte tuple object per hit
+BREAKOUT_DTYPE = np.dtype([('date', 'U10'), ('pct_above', 'f8'),
+                           ('close', 'f8'), ('volume', 'i8')])
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_rolling_mean(vol_bytes: bytes, dtype_str: str, ma_period: int) -> np.ndarray:
+    """
+    Memoized rolling volume mean, keyed on the raw volume bytes.
+
+    The moving average is identical across threshold sweeps on the same
+    ticker, so rescanning with a new threshold only repeats the cheap
+    mask step. The cached array is built on a read-only buffer and must
+    not be mutated by callers.
+    """
+    vol = np.frombuffer(vol_bytes, dtype=dtype_str)
+    return _rolling_mean_np(vol, ma_period)
+
+
+def scan_volume_breakout_array(data: pd.DataFrame, threshold: float = 0.10,
+                               ma_period: int = 50) -> np.ndarray:
+    """
+    Scan for volume breakouts, returning a structured ndarray.
+
+    Same scan as scan_volume_breakout but the hits come back as a
+    structured array with fields (date, pct_above, close, volume), so
+    downstream code can format, concatenate or write them without
+    re-iterating in Python.
+
+    Args:
+        data: Stock price data with OHLCV columns
+        threshold: Volume threshold above MA (default 0.10 = 10%)
+        ma_period: Moving average period in days (default 50)
+
+    Returns:
+        Structured ndarray of dtype BREAKOUT_DTYPE, one record per breakout
+    """
+    if len(data) <= ma_period:
+        return np.empty(0, dtype=BREAKOUT_DTYPE)
+
+    # float32 halves the bytes streamed per row; the rolling-mean kernel
+    # still accumulates its running sum in float64, so large volumes
+    # don't lose precision across long windows. The native-dtype array is
+    # kept for the reported volume field — float32 rounds integers above
+    # 2**24, which real daily volumes routinely exceed.
+    volume = data['Volume'].to_numpy()
+    vol = volume.astype(np.float32)
+    close = data['Close'].to_numpy(dtype=np.float32, copy=False)
+
+    # Early exit: every window average is at least the global minimum
+    # volume, so if the largest checked volume can't clear that floor by
+    # the threshold, no row can match and the rolling mean is skipped.
+    # (NaNs poison max/min into NaN, which fails and falls through.)
+    if vol[ma_period:].max() <= vol.min() * (1 + threshold):
+        return np.empty(0, dtype=BREAKOUT_DTYPE)
 
-def scan_volume_breakout(data: pd.DataFrame, threshold: float = 0.10, ma_period: int = 50) -> List[Tuple[str, int, int]]:
+    # O(n) running-sum rolling mean (compiled, NaN-aware): windows that
+    # are incomplete or contain a NaN volume come back as NaN and fail
+    # the comparison below, matching the old notna check on the pandas
+    # rolling mean. The caller's DataFrame is never modified, and the
+    # mean is memoized so threshold sweeps on the same ticker skip it.
+    avg = _cached_rolling_mean(vol.tobytes(), vol.dtype.str, ma_period)[ma_period:]
+
+    checked = vol[ma_period:]
+    with np.errstate(invalid='ignore'):
+        mask = checked > avg * (1 + threshold)
+
+    out = np.empty(int(mask.sum()), dtype=BREAKOUT_DTYPE)
+    out['date'] = date_strings(data.index)[ma_period:][mask]
+    out['pct_above'] = (checked[mask] / avg[mask] - 1.0) * 100.0
+    out['close'] = close[ma_period:][mask]
+    # Hit days always have a real volume (NaN days fail the comparison),
+    # so the int cast is well-defined; take it from the full-precision
+    # array, not the float32 working copy
+    out['volume'] = volume[ma_period:][mask]
+    return out
+
+
+def scan_volume_breakout(data: pd.DataFrame, threshold: float = 0.10, ma_period: int = 50) -> List[Tuple[str, float, float, int]]:
     """
     Scan for volume breakouts exceeding threshold above moving average.
-    
+
     Args:
         data: Stock price data with OHLCV columns
         threshold: Volume threshold above MA (default 0.10 = 10%)
         ma_period: Moving average period in days (default 50)
-    
+
     Returns:
-        List of tuples (date, volume, avg_volume)
+        List of tuples (date, pct_above_avg, close_price, volume)
         Each tuple represents a day with volume breakout
-    
+
     Example:
         >>> data = yf.download('GME', period='3mo')
         >>> results = scan_volume_breakout(data, threshold=0.10, ma_period=50)
-        >>> for date, vol, avg_vol in results:
-        ...     print(f"{date}: Volume {vol:,} vs avg {avg_vol:,}")
+        >>> for date, pct_above, price, vol in results:
+        ...     print(f"{date}: Volume {vol:,} is {pct_above:.2f}% above average")
     """
-    results = []
-    
-    if len(data) < ma_period:
-        return results
-    
-    # Calculate moving average of volume
-    data['VolumeMA'] = data['Volume'].rolling(window=ma_period).mean()
-    
-    # Find days where volume exceeds threshold above MA
-    for idx in range(ma_period, len(data)):
-        volume = data['Volume'].iloc[idx]
-        avg_volume = data['VolumeMA'].iloc[idx]
-        
-        if pd.notna(avg_volume) and volume > avg_volume * (1 + threshold):
-            date = data.index[idx].strftime('%Y-%m-%d')
-            results.append((date, int(volume), int(avg_volume)))
-    
-    return results
+    # Backwards-compat wrapper: tolist() on a structured array yields
+    # the historical list-of-tuples shape with native Python scalars
+    return scan_volume_breakout_array(data, threshold, ma_period).tolist()
 
 
-def format_results(results: List[Tuple[str, int, int]], ticker: str) -> List[dict]:
+def format_results(results: List[Tuple[str, float, float, int]], ticker: str) -> List[dict]:
     """
     Format scan results into a dictionary structure for display.
-    
+
     Args:
         results: List of tuples from scan_volume_breakout()
         ticker: Stock ticker symbol
-    
+
     Returns:
         List of dictionaries with formatted data
     """
-    formatted = []
-    
-    for date, volume, avg_volume in results:
-        pct_above = ((volume - avg_volume) / avg_volume) * 100
-        formatted.append({
-            'Ticker': ticker,
-            'Date': date,
-            'Volume': f"{volume:,}",
-            'Avg Volume (50d)': f"{avg_volume:,}",
-            'Above Avg (%)': f"{pct_above:.2f}"
-        })
-    
-    return formatted
+    if not results:
+        return []
+
+    # Build one frame from the tuples and format each column in a
+    # vectorized pass instead of per-row f-strings
+    df = pd.DataFrame(results, columns=['Date', 'pct', 'price', 'volume'])
+    return pd.DataFrame({
+        'Ticker': ticker,
+        'Date': df['Date'],
+        'Volume': df['volume'].map('{:,}'.format),
+        'Close Price': '$' + df['price'].map('{:.2f}'.format),
+        'Above Avg (%)': df['pct'].map('{:.2f}'.format),
+    }).to_dict('records')
 
 
 def get_description() -> str:
@@ -2,100 +2,165 @@
 Utility functions for fetching comprehensive stock ticker lists from various exchanges.
 Uses NASDAQ FTP service for complete US market coverage.
 """
+import functools
+import re
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 import yfinance as yf
+from pathlib import Path
 from typing import List
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from io import StringIO
-import urllib.request
 
 
+# Ticker lists change on the scale of days, so cache each fetcher's
+# result on disk and skip the network entirely while the file is fresh
+_CACHE_DIR = Path.home() / '.cache' / 'stock_scanner'
+_CACHE_TTL_SECONDS = 24 * 3600
+
+# One session for all list downloads: connections are reused across the
+# two symbol files and transient failures retry with backoff
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount('https://', HTTPAdapter(max_retries=Retry(
+    total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504])))
+
+# Browser-ish User-Agent shared by the Wikipedia fetchers
+_WIKI_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# Valid ticker: 1-5 uppercase letters/digits with optional dot or dash;
+# the lookahead requires at least one alphanumeric so pure punctuation
+# like '---' is rejected. Compiled once; a single C-level match replaces
+# the per-ticker replace().replace().isalnum() chain and its two
+# throwaway strings.
+_TICKER_RE = re.compile(r'\A(?=.*[A-Z0-9])[A-Z0-9.\-]{1,5}\Z')
+
+
+def _disk_cached(name: str):
+    """
+    Cache a ticker fetcher's result under ~/.cache/stock_scanner/<name>.txt.
+
+    A fresh cache file (younger than _CACHE_TTL_SECONDS) is returned as
+    one ticker per line without touching the network; otherwise the
+    wrapped fetcher runs and its (non-empty) result is written back.
+    Failed fetches are never cached, so transient errors retry next call.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            path = _CACHE_DIR / f"{name}.txt"
+            try:
+                if path.exists() and time.time() - path.stat().st_mtime < _CACHE_TTL_SECONDS:
+                    tickers = path.read_text().split()
+                    if tickers:
+                        print(f"✓ Loaded {len(tickers)} {name} tickers from disk cache")
+                        return tickers
+            except OSError:
+                pass
+
+            tickers = func(*args, **kwargs)
+
+            if tickers:
+                try:
+                    _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                    path.write_text('\n'.join(tickers))
+                except OSError:
+                    pass
+
+            return tickers
+        return wrapper
+    return decorator
+
+
+@_disk_cached('nasdaq_listed')
 def get_nasdaq_listed_stocks() -> List[str]:
     """
-    Fetch all NASDAQ-listed stocks from NASDAQ's official FTP server.
+    Fetch all NASDAQ-listed stocks from NASDAQ's official symbol directory.
     Returns comprehensive list of all NASDAQ stocks (typically 3000+).
     """
     try:
-        url = "ftp://ftp.nasdaqtrader.com/symboldirectory/nasdaqlisted.txt"
-        
-        print("   Downloading from NASDAQ FTP server...")
-        response = urllib.request.urlopen(url)
-        content = response.read().decode('utf-8')
-        
-        # Parse the pipe-delimited file
-        lines = content.strip().split('\n')
-        tickers = []
-        
-        for line in lines[1:]:  # Skip header
-            if '|' in line:
-                parts = line.split('|')
-                ticker = parts[0].strip()
-                # Filter out test symbols and invalid tickers
-                if ticker and not ticker.startswith('$') and ticker != 'Symbol':
-                    # Check if it's a valid ticker (not the file footer)
-                    if ticker and len(ticker) <= 5 and ticker.replace('-', '').replace('.', '').isalnum():
-                        tickers.append(ticker)
+        # NASDAQ publishes the symbol directory over HTTPS too; the shared
+        # session reuses the connection for the second file and retries
+        # transient failures
+        url = "https://www.nasdaqtrader.com/dynamic/SymDir/nasdaqlisted.txt"
+
+        print("   Downloading NASDAQ symbol directory...")
+        response = _HTTP_SESSION.get(url, stream=True, timeout=30)
+        response.raise_for_status()
+        response.raw.decode_content = True
+
+        # Parse the pipe-delimited file straight from the socket with
+        # pandas' C parser; only the symbol column is materialized
+        df = pd.read_csv(response.raw, sep='|', usecols=[0], dtype=str, na_filter=False)
+        symbols = df.iloc[:, 0].str.strip()
+
+        # Filter out test symbols ($-prefixed), the file footer and
+        # anything that is not a valid ticker, all in vectorized passes
+        mask = ~symbols.str.startswith('$') & symbols.str.match(_TICKER_RE)
+        tickers = symbols[mask].tolist()
         
-        print(f"✓ Fetched {len(tickers)} NASDAQ-listed stocks from FTP")
+        print(f"✓ Fetched {len(tickers)} NASDAQ-listed stocks")
         return tickers
-        
+
     except Exception as e:
-        print(f"✗ Error fetching NASDAQ FTP data: {e}")
+        print(f"✗ Error fetching NASDAQ symbol directory: {e}")
         return []
 
 
+@_disk_cached('other_listed')
 def get_other_listed_stocks() -> List[str]:
     """
-    Fetch all NYSE and other exchange-listed stocks from NASDAQ's FTP server.
+    Fetch all NYSE and other exchange-listed stocks from NASDAQ's symbol directory.
     Returns comprehensive list of non-NASDAQ stocks (typically 3000+).
     """
     try:
-        url = "ftp://ftp.nasdaqtrader.com/symboldirectory/otherlisted.txt"
-        
-        print("   Downloading from NASDAQ FTP server...")
-        response = urllib.request.urlopen(url)
-        content = response.read().decode('utf-8')
-        
-        # Parse the pipe-delimited file
-        lines = content.strip().split('\n')
-        tickers = []
-        
-        for line in lines[1:]:  # Skip header
-            if '|' in line:
-                parts = line.split('|')
-                ticker = parts[0].strip()
-                # Filter out test symbols and invalid tickers
-                if ticker and not ticker.startswith('$') and ticker != 'ACT Symbol':
-                    # Check if it's a valid ticker
-                    if ticker and len(ticker) <= 5 and ticker.replace('-', '').replace('.', '').isalnum():
-                        tickers.append(ticker)
+        # Same HTTPS mirror and shared session as the NASDAQ-listed file
+        url = "https://www.nasdaqtrader.com/dynamic/SymDir/otherlisted.txt"
+
+        print("   Downloading NYSE/Other symbol directory...")
+        response = _HTTP_SESSION.get(url, stream=True, timeout=30)
+        response.raise_for_status()
+        response.raw.decode_content = True
+
+        # Parse the pipe-delimited file straight from the socket with
+        # pandas' C parser; only the symbol column is materialized
+        df = pd.read_csv(response.raw, sep='|', usecols=[0], dtype=str, na_filter=False)
+        symbols = df.iloc[:, 0].str.strip()
+
+        # Filter out test symbols ($-prefixed), the file footer and
+        # anything that is not a valid ticker, all in vectorized passes
+        mask = ~symbols.str.startswith('$') & symbols.str.match(_TICKER_RE)
+        tickers = symbols[mask].tolist()
         
-        print(f"✓ Fetched {len(tickers)} NYSE/Other-listed stocks from FTP")
+        print(f"✓ Fetched {len(tickers)} NYSE/Other-listed stocks")
         return tickers
-        
+
     except Exception as e:
-        print(f"✗ Error fetching NYSE/Other FTP data: {e}")
+        print(f"✗ Error fetching NYSE/Other symbol directory: {e}")
         return []
 
 
+@_disk_cached('sp500')
 def get_sp500_tickers() -> List[str]:
     """
     Fetch S&P 500 ticker symbols from Wikipedia.
     Returns approximately 500 stocks.
     """
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
         url = 'https://en.wikipedia.org/wiki/List_of_S%26P_500_companies'
-        
-        response = requests.get(url, headers=headers)
+
+        response = _HTTP_SESSION.get(url, headers=_WIKI_HEADERS, timeout=30)
         response.raise_for_status()
-        
-        tables = pd.read_html(StringIO(response.text))
-        # Wikipedia has a warning message in table 0, actual data is in table 1
-        sp500_df = tables[1]
+
+        # Parse only the constituents table instead of every table on
+        # the page; Wikipedia tags it with id="constituents"
+        tables = pd.read_html(StringIO(response.text), match='Symbol',
+                              attrs={'id': 'constituents'})
+        sp500_df = tables[0]
         tickers = sp500_df['Symbol'].tolist()
         
         # Clean tickers
@@ -109,62 +174,56 @@ def get_sp500_tickers() -> List[str]:
         return []
 
 
+@_disk_cached('nasdaq100')
 def get_nasdaq100_tickers() -> List[str]:
     """
     Fetch NASDAQ-100 ticker symbols from Wikipedia.
     Returns approximately 100 stocks.
     """
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
         url = 'https://en.wikipedia.org/wiki/NASDAQ-100'
-        
-        response = requests.get(url, headers=headers)
+
+        response = _HTTP_SESSION.get(url, headers=_WIKI_HEADERS, timeout=30)
         response.raise_for_status()
-        
-        tables = pd.read_html(StringIO(response.text))
-        
-        for table in tables:
-            if 'Ticker' in table.columns:
-                tickers = table['Ticker'].tolist()
-                cleaned_tickers = [str(ticker).replace('.', '-') for ticker in tickers if pd.notna(ticker)]
-                print(f"✓ Fetched {len(cleaned_tickers)} NASDAQ-100 tickers")
-                return cleaned_tickers
-        
-        print("✗ Could not find NASDAQ-100 ticker table")
-        return []
-        
+
+        # Parse only the constituents table instead of every table on
+        # the page; read_html raises ValueError if it's missing, which
+        # lands in the except below like the old not-found path
+        tables = pd.read_html(StringIO(response.text), match='Ticker',
+                              attrs={'id': 'constituents'})
+        tickers = tables[0]['Ticker'].tolist()
+        cleaned_tickers = [str(ticker).replace('.', '-') for ticker in tickers if pd.notna(ticker)]
+
+        print(f"✓ Fetched {len(cleaned_tickers)} NASDAQ-100 tickers")
+        return cleaned_tickers
+
     except Exception as e:
         print(f"✗ Error fetching NASDAQ-100 tickers: {e}")
         return []
 
 
+@_disk_cached('dow30')
 def get_dow30_tickers() -> List[str]:
     """
     Fetch Dow Jones Industrial Average (DJIA) 30 ticker symbols.
     """
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
         url = 'https://en.wikipedia.org/wiki/Dow_Jones_Industrial_Average'
-        
-        response = requests.get(url, headers=headers)
+
+        response = _HTTP_SESSION.get(url, headers=_WIKI_HEADERS, timeout=30)
         response.raise_for_status()
-        
-        tables = pd.read_html(StringIO(response.text))
-        
-        for table in tables:
-            if 'Symbol' in table.columns and len(table) == 30:
-                tickers = table['Symbol'].tolist()
-                cleaned_tickers = [str(ticker).replace('.', '-') for ticker in tickers if pd.notna(ticker)]
-                print(f"✓ Fetched {len(cleaned_tickers)} Dow 30 tickers")
-                return cleaned_tickers
-        
-        print("✗ Could not find Dow 30 ticker table")
-        return []
-        
+
+        # Parse only the constituents table instead of every table on
+        # the page; read_html raises ValueError if it's missing, which
+        # lands in the except below like the old not-found path
+        tables = pd.read_html(StringIO(response.text), match='Symbol',
+                              attrs={'id': 'constituents'})
+        tickers = tables[0]['Symbol'].tolist()
+        cleaned_tickers = [str(ticker).replace('.', '-') for ticker in tickers if pd.notna(ticker)]
+
+        print(f"✓ Fetched {len(cleaned_tickers)} Dow 30 tickers")
+        return cleaned_tickers
+
     except Exception as e:
         print(f"✗ Error fetching Dow 30 tickers: {e}")
         return []
@@ -214,6 +273,25 @@ def get_amex_tickers() -> List[str]:
     return amex_tickers
 
 
+def get_megacap_fallback() -> List[str]:
+    """
+    Curated mega-cap list for offline mode.
+
+    Only used when every network source fails, so a scan still has
+    something meaningful to chew on instead of returning empty. This is
+    deliberately not wired into the normal paths — it covers ~1% of the
+    market and must never silently replace the comprehensive lists.
+    """
+    return [
+        'AAPL', 'MSFT', 'GOOGL', 'GOOG', 'AMZN', 'NVDA', 'META', 'TSLA',
+        'BRK-B', 'LLY', 'AVGO', 'JPM', 'V', 'UNH', 'XOM', 'MA', 'JNJ',
+        'PG', 'HD', 'COST', 'ORCL', 'MRK', 'ABBV', 'CVX', 'CRM', 'BAC',
+        'KO', 'AMD', 'PEP', 'NFLX', 'WMT', 'TMO', 'ADBE', 'LIN', 'MCD',
+        'CSCO', 'ACN', 'ABT', 'INTC', 'DIS', 'INTU', 'WFC', 'TXN', 'QCOM',
+        'VZ', 'IBM', 'CAT', 'GE', 'NOW', 'AMGN'
+    ]
+
+
 def get_comprehensive_us_tickers() -> List[str]:
     """
     Fetch comprehensive US market ticker symbols from NASDAQ FTP sources.
@@ -225,45 +303,43 @@ def get_comprehensive_us_tickers() -> List[str]:
     print("Using NASDAQ FTP Service for Complete Market Coverage")
     print("="*70 + "\n")
     
+    # The three sources are independent read-only fetches, so run them
+    # concurrently; wall-clock time drops to the slowest single fetch
+    print("Fetching NASDAQ-listed, NYSE/Other-listed and ETF lists in parallel...")
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        nasdaq_future = executor.submit(get_nasdaq_listed_stocks)
+        other_future = executor.submit(get_other_listed_stocks)
+        amex_future = executor.submit(get_amex_tickers)
+
+        nasdaq_listed = nasdaq_future.result()
+        other_listed = other_future.result()
+        amex = amex_future.result()
+
     all_tickers = []
-    
-    # Get all NASDAQ-listed stocks from FTP (3000+)
-    print("[1/3] Fetching all NASDAQ-listed stocks...")
-    nasdaq_listed = get_nasdaq_listed_stocks()
+
     if nasdaq_listed:
         all_tickers.extend(nasdaq_listed)
-        print(f"      ✓ Added {len(nasdaq_listed)} NASDAQ stocks\n")
-    
-    # Get all NYSE and other exchange-listed stocks from FTP (3000+)
-    print("[2/3] Fetching all NYSE and other exchange-listed stocks...")
-    other_listed = get_other_listed_stocks()
+        print(f"      ✓ Added {len(nasdaq_listed)} NASDAQ stocks")
     if other_listed:
         all_tickers.extend(other_listed)
-        print(f"      ✓ Added {len(other_listed)} NYSE/Other stocks\n")
-    
-    # Add major ETFs
-    print("[3/3] Adding major ETFs...")
-    amex = get_amex_tickers()
+        print(f"      ✓ Added {len(other_listed)} NYSE/Other stocks")
     if amex:
         all_tickers.extend(amex)
         print(f"      ✓ Added {len(amex)} ETFs\n")
+
+    # Offline mode: if both exchange listings failed, fall back to the
+    # curated mega-cap list rather than scanning nothing
+    if not nasdaq_listed and not other_listed:
+        fallback = get_megacap_fallback()
+        all_tickers.extend(fallback)
+        print(f"      ⚠ Exchange listings unavailable; added {len(fallback)} mega-cap fallback tickers")
     
-    # Remove duplicates and clean
-    unique_tickers = list(set(all_tickers))
-    
-    # Filter out invalid tickers
-    valid_tickers = []
-    for ticker in unique_tickers:
-        if isinstance(ticker, str):
-            ticker = ticker.strip()
-            # Accept tickers that are 1-5 characters
-            if 1 <= len(ticker) <= 5:
-                # Allow alphanumeric with optional dash or dot
-                clean_ticker = ticker.replace('-', '').replace('.', '')
-                if clean_ticker.isalnum():
-                    valid_tickers.append(ticker)
-    
-    valid_tickers = sorted(valid_tickers)
+    # Deduplicate, clean and validate in a single pass; the set handles
+    # cross-exchange duplicates and sorted() gives the stable ordering
+    valid_tickers = sorted({
+        ticker.strip() for ticker in all_tickers
+        if isinstance(ticker, str) and _TICKER_RE.match(ticker.strip())
+    })
     
     print("="*70)
     print(f"✓ TOTAL UNIQUE VALID TICKERS: {len(valid_tickers)}")